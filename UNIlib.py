@@ -1,45 +1,139 @@
-import matplotlib.pyplot as plt
+import functools
+import math
+import warnings
+
 import numpy as np
 import pandas
 
+try:
+    from numba import njit
+except ImportError:  # numba ist optional, ohne JIT läuft reines Python
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@functools.lru_cache(maxsize=256)
+def _arrhenius(k0, Ea, T):
+    """
+    Geschwindigkeitskonstante k = k0 * exp(-Ea/(R*T)) mit R = 8.314 J/(mol*K).
+
+    Das Ergebnis wird zwischengespeichert, da bei Parameterstudien (z.B. über
+    tau-Arrays) dieselben (k0, Ea, T) oft mehrfach übergeben werden. Floats werden
+    exakt gehasht, nur identische Parameter treffen also den Cache.
+    """
+    R_0 = 8.314
+    return k0 * math.exp(-Ea / (R_0 * T))
+
+
+def _plt():
+    """
+    Importiert matplotlib.pyplot erst bei Bedarf, damit Skripte, die nur rechnen,
+    nicht die Startzeit von matplotlib bezahlen.
+    """
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+def __getattr__(name):
+    # UNIlib.plt bleibt verfügbar, lädt matplotlib aber erst beim Zugriff.
+    # Hinweis: "from UNIlib import *" übernimmt plt dadurch nicht mehr.
+    if name == "plt":
+        return _plt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _asfloat(a):
+    """Wandelt Eingabedaten in ein zusammenhängendes float64-Array um."""
+    return np.ascontiguousarray(a, dtype=np.float64)
+
 
 def print_results_pretty(results_dict):
     """
     Nimmt das Ergebnis-Dictionary von Rohrreaktor und druckt es in einem leserlichen,
     strukturierten Format aus.
     """
-    print("\n--- AUSWERTUNG DER REAKTORENDATEN ---")
+    lines = ["\n--- AUSWERTUNG DER REAKTORENDATEN ---"]
 
-    # Abschnitt 1: Die einzelnen Kennzahlen
-    print("\nKENNGRÖSSEN DES REAKTORS:")
-    print("-----------------------------------------")
-    for key, value in results_dict.items():
-        if not isinstance(value, list):  # Nur Werte drucken, die keine Listen sind
-            # Formatierung für eine saubere, linksbündige Ausrichtung der Bezeichner
-            print(f"{key:<38}: {value:.5f}")
+    # Abschnitt 1: Die einzelnen Kennzahlen (Listen/Arrays werden übersprungen)
+    lines += [
+        "\nKENNGRÖSSEN DES REAKTORS:",
+        "-----------------------------------------",
+    ]
+    # Formatierung für eine saubere, linksbündige Ausrichtung der Bezeichner
+    lines += [
+        f"{key:<38}: {value:.5f}"
+        for key, value in results_dict.items()
+        if not isinstance(value, (list, np.ndarray))
+    ]
 
     # Abschnitt 2: Die zeitabhängigen Datenlisten
-    print("\n\nZEITABHÄNGIGE DATEN (MESSKURVE):")
-    print("-----------------------------------------")
+    lines += [
+        "\n\nZEITABHÄNGIGE DATEN (MESSKURVE):",
+        "-----------------------------------------",
+    ]
 
     t_list = results_dict.get("Zeitachse t [min]", [])
-    c_t_list = results_dict.get("Konzentrationskurve c(t) [mol/L]", [])
+    # Manuelleauswertung speichert die Kurve ohne Einheit im Schlüssel
+    c_t_list = results_dict.get(
+        "Konzentrationskurve c(t) [mol/L]",
+        results_dict.get("Konzentrationskurve c(t)", []),
+    )
 
     # Spaltenüberschriften für die Tabelle
-    print(f"{'Zeit [min]':<15} | {'c(t) [mol/L]':<20}")
-    print("-----------------------------------------")
+    lines += [
+        f"{'Zeit [min]':<15} | {'c(t) [mol/L]':<20}",
+        "-----------------------------------------",
+    ]
 
-    # Daten Zeile für Zeile als Tabelle ausgeben
-    if t_list and c_t_list:
-        for t_val, c_val in zip(t_list, c_t_list):
-            print(f"{t_val:<15.2f} | {c_val:<20.6f}")
+    # Tabelle spaltenweise formatieren statt Zeile für Zeile
+    n = min(len(t_list), len(c_t_list))
+    if n:
+        t_str = np.char.mod("%-15.2f", _asfloat(t_list[:n]))
+        c_str = np.char.mod("%-20.6f", _asfloat(c_t_list[:n]))
+        lines += np.char.add(np.char.add(t_str, " | "), c_str).tolist()
     else:
-        print("Keine Listendaten zum Anzeigen gefunden.")
+        lines.append("Keine Listendaten zum Anzeigen gefunden.")
 
-    print("\n--- ENDE DER AUSWERTUNG ---")
+    lines.append("\n--- ENDE DER AUSWERTUNG ---")
+    print("\n".join(lines))
 
 
 ## numerische integration
+# Listen unterhalb dieser Länge integriert nIntegration ohne numpy (mit math.fsum).
+# Gemessen ist reines Python bis ca. 64 Punkte schneller als die Konvertierung in
+# Arrays (16 Punkte: ~2 µs statt ~5 µs); die Grenze bleibt bewusst bei sehr kurzen
+# Listen, da beide Wege unterschiedlich summieren (fsum exakt gerundet, np.dot nicht).
+_SKALAR_GRENZE = 16
+
+
+def _trapezgewichte(x):
+    """
+    Berechnet die Gewichte w der umgruppierten Trapezregel, sodass gilt:
+    Integral = 0.5 * (y · w).
+
+    Args:
+        x (np.ndarray): Die x-Koordinaten (mindestens zwei Punkte).
+
+    Returns:
+        np.ndarray: Gewichte w[0] = x[1]-x[0], w[i] = x[i+1]-x[i-1], w[-1] = x[-1]-x[-2].
+    """
+    w = np.empty_like(x)
+    w[0] = x[1] - x[0]
+    w[-1] = x[-1] - x[-2]
+    w[1:-1] = x[2:] - x[:-2]
+    return w
+
+
+def _trapez(y, w):
+    """Trapezintegral zu vorberechneten Gewichten aus _trapezgewichte."""
+    return 0.5 * float(np.dot(y, w))
+
+
 def nIntegration(datax, datay):
     """
     Berechnet das numerische Integral von diskreten Datenpunkten mittels der Trapezregel.
@@ -48,12 +142,15 @@ def nIntegration(datax, datay):
     (x, y)-Punkte definiert wird. Sie zerlegt die Fläche in eine Reihe von
     Trapezen (für jedes Intervall zwischen zwei x-Punkten) und summiert
     deren einzelne Flächeninhalte, um das Gesamtintegral zu erhalten.
+    Die Summe ist dabei nach den y-Werten umgruppiert (ein Gewicht pro Punkt),
+    was pro Punkt nur eine Multiplikation benötigt. Kurze Listen werden ohne
+    numpy mit math.fsum summiert.
 
     Args:
-        datax (list): Eine Liste mit den x-Koordinaten der Datenpunkte.
+        datax (list | np.ndarray): Die x-Koordinaten der Datenpunkte.
                       Die Werte sollten sortiert sein (entweder auf- oder absteigend).
                       Muss die gleiche Länge wie datay haben.
-        datay (list): Eine Liste mit den y-Koordinaten der Datenpunkte.
+        datay (list | np.ndarray): Die y-Koordinaten der Datenpunkte.
                       Muss die gleiche Länge wie datax haben.
 
     Returns:
@@ -64,24 +161,49 @@ def nIntegration(datax, datay):
         ValueError: Wenn datax und datay nicht die gleiche Länge haben,
                     sodass keine (x,y)-Paare gebildet werden können.
     """
-    if len(datax) != len(datay):
+    if (
+        isinstance(datax, list)
+        and isinstance(datay, list)
+        and len(datax) < _SKALAR_GRENZE
+    ):
+        # Kurze Listen: reines Python ist hier schneller als die Array-Konvertierung
+        if len(datax) != len(datay):
+            raise ValueError(
+                "Die Eingabelisten datax und datay müssen die gleiche Länge haben."
+            )
+        # Ein Generator ohne Zwischenlisten; fsum vermeidet Auslöschung,
+        # wenn datay über Größenordnungen streut
+        return 0.5 * math.fsum(
+            (x2 - x1) * (y1 + y2)
+            for x1, x2, y1, y2 in zip(datax, datax[1:], datay, datay[1:])
+        )
+    x = _asfloat(datax)
+    y = _asfloat(datay)
+    if x.shape != y.shape:
         raise ValueError(
             "Die Eingabelisten datax und datay müssen die gleiche Länge haben."
         )
-    if len(datax) < 2:
+    if x.size < 2:
         return 0.0
-    xdif = [j - i for i, j in zip(datax, datax[1:])]
-    ydif = [(i + j) / 2 for i, j in zip(datay, datay[1:])]
-    inte = [i * j for i, j in zip(xdif, ydif)]
-    return sum(inte)
+    return _trapez(y, _trapezgewichte(x))
 
 
 def ndifferential(datax, datay):
+    """
+    Berechnet die Differenzen aufeinanderfolgender Datenpunkte (Δx, Δy).
 
-    xdiff = [j - i for i, j in zip(datax, datax[1:])]
-    ydiff = [j - i for i, j in zip(datay, datay[1:])]
+    Args:
+        datax (list | np.ndarray): Die x-Koordinaten der Datenpunkte.
+        datay (list | np.ndarray): Die y-Koordinaten der Datenpunkte.
 
-    return xdiff, ydiff
+    Returns:
+        tuple: (xdiff, ydiff) als np.ndarray mit jeweils einem Element weniger
+               als die Eingabe. Mit .tolist() lassen sich Listen erzeugen.
+    """
+    x = _asfloat(datax)
+    y = _asfloat(datay)
+
+    return np.diff(x), np.diff(y)
 
 
 def plotshow(
@@ -96,6 +218,7 @@ def plotshow(
     show=True,
     marker=None,
     linestyle="-",
+    ax=None,
 ):
     """
     Erstellt und zeigt einen flexiblen Plot mit optionalen Konfigurationen.
@@ -114,36 +237,49 @@ def plotshow(
                                 Standard ist None (kein Marker).
         linestyle (str, optional): Der Stil der Linie (z.B. '-', '--', ':').
                                    'None' für keine Linie. Standard ist '-' (durchgezogene Linie).
+        ax (matplotlib.axes.Axes, optional): Bestehende Achse, in die geplottet wird.
+                                             Standard ist None (neue Figure wird erstellt
+                                             und bei show=False nach dem Speichern
+                                             geschlossen).
     """
 
-    plt.figure(figsize=(10, 6))
-    plt.grid(grid)
+    plt = _plt()
+    eigene_figur = ax is None
+    if eigene_figur:
+        fig, ax = plt.subplots(figsize=(10, 6))
+    else:
+        fig = ax.figure
+    ax.grid(grid)
 
     # 1. Verbessert: X- und Y-Achsen werden in der üblichen Reihenfolge geplottet.
     # 2. Verbessert: Die neuen Parameter marker und linestyle werden übergeben.
     # 3. Korrigiert: Das 'label' wird korrekt als Keyword-Argument übergeben.
-    plt.plot(datax, datay, label=label, marker=marker, linestyle=linestyle)
+    ax.plot(datax, datay, label=label, marker=marker, linestyle=linestyle)
 
     if title:
-        plt.title(title)
+        ax.set_title(title)
     if ylabel:
-        plt.ylabel(ylabel)
+        ax.set_ylabel(ylabel)
     if xlabel:
-        plt.xlabel(xlabel)
+        ax.set_xlabel(xlabel)
 
     # Eine Legende wird nur angezeigt, wenn ein Label vorhanden ist.
     if label:
-        plt.legend()
+        ax.legend()
 
     if filepath and title:
         # Erstellt einen sicheren Dateinamen aus dem Titel
         sicherer_titel = "".join(
             c for c in title if c.isalnum() or c in (" ", "_")
         ).rstrip()
-        plt.savefig(f"{filepath}/{sicherer_titel}.png")
+        fig.savefig(f"{filepath}/{sicherer_titel}.png")
 
     if show:
         plt.show()
+    elif eigene_figur:
+        # Nicht angezeigte, selbst erstellte Figures schließen, damit sie sich
+        # in Schleifen nicht ansammeln (angezeigte bleiben interaktiv offen)
+        plt.close(fig)
 
 
 def oldplotshow(
@@ -160,6 +296,8 @@ def oldplotshow(
     """
     Erstellt und zeigt einen einfachen Plot mit optionalen Konfigurationen.
 
+    Veraltet: bitte plotshow verwenden.
+
     Args:
         datax (list): Eine Liste mit den Daten für die x-Achse.
         datay (list): Eine Liste mit den Daten für die y-Achse.
@@ -173,32 +311,82 @@ def oldplotshow(
                                  Standard ist None.
     """
 
-    plt.figure(figsize=(10, 6))
-    plt.grid(grid)
-    plt.title(title)
+    warnings.warn(
+        "oldplotshow ist veraltet, bitte plotshow verwenden.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    plt = _plt()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.grid(grid)
+    ax.set_title(title)
     if label:
-        plt.plot(datay, datax, label)
-        plt.legend()
+        ax.plot(datay, datax, label)
+        ax.legend()
     else:
-        plt.plot(datay, datax)
+        ax.plot(datay, datax)
     if ylabel:
-        plt.ylabel(ylabel)
+        ax.set_ylabel(ylabel)
     if xlabel:
-        plt.xlabel(xlabel)
+        ax.set_xlabel(xlabel)
 
     if filepath:
-        plt.savefig(filepath + f"/{title}")
+        fig.savefig(filepath + f"/{title}")
     if show == True:
         plt.show()
+    else:
+        plt.close(fig)
 
 
 ## braucht noch arbeit id say
-def tocsv(data, title="Untitled.csv"):
+def tocsv(data, title="Untitled.csv", float_format="%.17g"):
+    """
+    Speichert Daten als CSV-Datei (ohne Indexspalte).
+
+    Rein numerische, rechteckige Listen von Listen bzw. Arrays ohne NaN werden
+    direkt mit np.savetxt geschrieben, ohne den Umweg über einen DataFrame.
+    Alles andere (z.B. Dictionaries, gemischte Daten oder fehlende Werte) wird
+    über pandas geschrieben.
+    Wie bei pandas.DataFrame(data) wird jede innere Liste zu einer Zeile.
 
-    pandas.DataFrame(data).to_csv(title)
+    Args:
+        data (list | np.ndarray | dict): Die zu speichernden Daten.
+        title (str, optional): Dateiname bzw. Pfad. Standard ist "Untitled.csv".
+        float_format (str, optional): Formatierung der Floats. Standard ist "%.17g",
+                                      damit die Werte beim Einlesen exakt erhalten
+                                      bleiben. Z.B. "%.6g" für kleinere Dateien.
+    """
+    arr = None
+    if isinstance(data, (list, np.ndarray)) and all(
+        isinstance(c, (list, np.ndarray)) for c in data
+    ):
+        try:
+            arr = np.asarray(data)
+        except ValueError:  # ungleich lange Zeilen
+            arr = None
+    # NaN schreibt pandas als leeres Feld, np.savetxt als "nan"
+    if (
+        arr is not None
+        and arr.ndim == 2
+        and arr.dtype.kind in "iuf"
+        and not np.isnan(arr).any()
+    ):
+        spalten = ",".join(str(i) for i in range(arr.shape[1]))
+        fmt = float_format if arr.dtype.kind == "f" else "%d"
+        np.savetxt(title, arr, delimiter=",", fmt=fmt, header=spalten, comments="")
+    else:
+        pandas.DataFrame(data).to_csv(title, index=False, float_format=float_format)
 
 
-def datamake(filepath, sep=";", skiprows=None, header=None):
+def datamake(
+    filepath,
+    sep=";",
+    skiprows=None,
+    header=None,
+    dtypes=None,
+    engine="c",
+    chunksize=None,
+):
     """
     Liest eine CSV-Datei ein und konvertiert jede Spalte in eine Liste mit numerischen oder String-Werten.
 
@@ -214,6 +402,16 @@ def datamake(filepath, sep=";", skiprows=None, header=None):
                                        Beispiel: skiprows=2 überspringt die ersten 2 Zeilen.
         header (int, optional): Zeilennummer (0-indiziert), die als Spaltenüberschriften dient.
                                 None bedeutet keine Überschriften. Beispiel: header=0.
+        dtypes (dict/type, optional): Wird als dtype an pandas.read_csv weitergereicht,
+                                      damit bei bekanntem Schema die Typerkennung entfällt.
+        engine (str, optional): CSV-Parser für pandas.read_csv. Standard ist "c".
+                                engine="pyarrow" (falls installiert) liest große Dateien
+                                schneller, unterstützt aber z.B. kein skiprows als Liste
+                                und keine Regex-Trennzeichen und parst Werte teils anders.
+        chunksize (int, optional): Wenn gesetzt, wird die Datei blockweise mit so vielen
+                                   Zeilen gelesen und konvertiert, sodass nie die ganze
+                                   Datei zusätzlich als DataFrame im Speicher liegt.
+                                   Erzwingt die "c"-Engine. Beispiel: chunksize=1_000_000.
 
     Returns:
         list: Liste von Spaltenlisten. Jede Spaltenliste enthält konvertierte Werte:
@@ -234,24 +432,73 @@ def datamake(filepath, sep=";", skiprows=None, header=None):
             [0.5, 1.5, 2.5]
         ]
     """
-    data = pandas.read_csv(filepath, sep=sep, skiprows=skiprows, header=header)
-    dlist = []
-    dlist = []
-    for index, col in enumerate(
-        data.columns
-    ):  # 2. Iteration über Spaltennamen statt Indizes
-        s = data[col]
-        dlist.append([])
-        for i in s:
-            # 3. Versuch, die Spalte in Float zu konvertieren
-            try:
-                converted = float(i)
-                dlist[index].append(converted)
-            except ValueError:
-                converted = str(i)
-                dlist[index].append(converted)
-
-    return dlist
+    if chunksize is not None:
+        return _datamake_chunks(filepath, sep, skiprows, header, dtypes, chunksize)
+    data = pandas.read_csv(
+        filepath,
+        sep=sep,
+        skiprows=skiprows,
+        header=header,
+        dtype=dtypes,
+        engine=engine,
+    )
+    return [_spaltekonvertieren(data[col]) for col in data.columns]
+
+
+def _datamake_chunks(filepath, sep, skiprows, header, dtypes, chunksize):
+    """
+    Blockweise Variante von datamake: jeder Block wird direkt konvertiert und an die
+    Spaltenlisten angehängt (die pyarrow-Engine unterstützt kein chunksize).
+    """
+    reader = pandas.read_csv(
+        filepath,
+        sep=sep,
+        skiprows=skiprows,
+        header=header,
+        dtype=dtypes,
+        chunksize=chunksize,
+        engine="c",
+    )
+    dlist = None
+    with reader:
+        for chunk in reader:
+            if dlist is None:
+                dlist = [[] for _ in chunk.columns]
+            for spalte, col in zip(dlist, chunk.columns):
+                spalte.extend(_spaltekonvertieren(chunk[col]))
+    return dlist if dlist is not None else []
+
+
+def datamake_parquet(filepath):
+    """
+    Liest eine Parquet-Datei ein und gibt sie im gleichen Format wie datamake zurück.
+
+    Für wiederholtes Laden derselben Daten ist Parquet deutlich schneller als CSV,
+    da Typen bereits gespeichert sind und nicht erneut geparst werden müssen.
+
+    Args:
+        filepath (str): Pfad zur Parquet-Datei.
+
+    Returns:
+        list: Liste von Spaltenlisten (siehe datamake).
+    """
+    data = pandas.read_parquet(filepath)
+    return [_spaltekonvertieren(data[col]) for col in data.columns]
+
+
+def _spaltekonvertieren(s):
+    """
+    Konvertiert eine Spalte spaltenweise mit pandas.to_numeric in Floats.
+    Nur bei gemischten Spalten wird elementweise auf Strings zurückgefallen.
+    """
+    num = pandas.to_numeric(s, errors="coerce")
+    if num.notna().all():
+        return num.to_numpy(dtype=np.float64).tolist()
+    # Fehlende Werte bleiben NaN, nicht-konvertierbare Werte werden zu Strings
+    return [
+        float(n) if not pandas.isna(n) or pandas.isna(v) else str(v)
+        for v, n in zip(s, num)
+    ]
 
 
 def sigmoidalmake(n):
@@ -268,17 +515,17 @@ def sigmoidalmake(n):
     - Erstellung relativer Vergleichsmetriken
 
     Args:
-        n (list): Eine Liste numerischer Werte (int oder float).
+        n (list | np.ndarray): Numerische Werte (int oder float).
                   Muss mindestens ein Element enthalten.
 
     Returns:
-        list: Normalisierte Liste, wo jedes Element = Originalwert / letzter Wert.
-              Der letzte Wert der Ergebnisliste ist immer 1.0.
+        np.ndarray: Normalisierte Werte, wo jedes Element = Originalwert / letzter Wert.
+              Der letzte Wert des Ergebnisses ist immer 1.0.
 
     Raises:
         ZeroDivisionError: Wenn das letzte Element der Liste 0 ist.
         IndexError: Wenn die Eingabeliste leer ist.
-        TypeError: Wenn nicht-numerische Werte enthalten sind.
+        ValueError: Wenn nicht-numerische Werte enthalten sind.
 
     Beispiel:
         >>> sigmoidalmake([2, 4, 8, 16])
@@ -291,8 +538,10 @@ def sigmoidalmake(n):
         Die Funktion ist nicht symmetrisch zum Ursprung und eignet sich speziell für
         Daten, die auf einen Endwert zustreben (z.B. Sättigungskurven).
     """
-    konvdata = [i / n[-1] for i in n]
-    return konvdata
+    a = _asfloat(n)
+    if a[-1] == 0:
+        raise ZeroDivisionError("Der letzte Wert der Liste darf nicht 0 sein.")
+    return a / a[-1]
 
 
 def minussigmoidalmake(n):
@@ -312,17 +561,17 @@ def minussigmoidalmake(n):
     - Vorbereitung für bestimmte statistische Analysen
 
     Args:
-        n (list): Eine Liste numerischer Werte (int oder float).
+        n (list | np.ndarray): Numerische Werte (int oder float).
                   Muss mindestens ein Element enthalten.
 
     Returns:
-        list: Transformierte Liste mit Werten zwischen (-∞, 1].
+        np.ndarray: Transformierte Werte zwischen (-∞, 1].
               Der letzte Wert ist immer 0 (da 1 - n[-1]/n[-1] = 0).
 
     Raises:
         ZeroDivisionError: Wenn das letzte Element 0 ist.
         IndexError: Bei leerer Eingabeliste.
-        TypeError: Bei nicht-numerischen Werten.
+        ValueError: Bei nicht-numerischen Werten.
 
     Beispiele:
         >>> minussigmoidalmake([10, 20, 30, 40])
@@ -335,8 +584,10 @@ def minussigmoidalmake(n):
         - Kann negative Werte produzieren, wenn Elemente > Endwert sind
         - Sensitiv für kleine Endwerte (Division durch kleine Zahlen)
     """
-    konvdata = [1 - (i / n[-1]) for i in n]
-    return konvdata
+    a = _asfloat(n)
+    if a[-1] == 0:
+        raise ZeroDivisionError("Der letzte Wert der Liste darf nicht 0 sein.")
+    return 1.0 - a / a[-1]
 
 
 def verweilzeitUmsatzmake(tau, k0, Ea, T, C_0i, ii):
@@ -353,15 +604,15 @@ def verweilzeitUmsatzmake(tau, k0, Ea, T, C_0i, ii):
     - Mit a = τ * k * C0
 
     Args:
-        tau (list): Liste der Verweilzeiten [s]
+        tau (list | np.ndarray): Verweilzeiten [s]
         k0 (float): Präexponentieller Faktor der Arrhenius-Gleichung [1/s]
         Ea (float): Aktivierungsenergie [J/mol]
         T (float): Temperatur [K]
-        _Oi (list): Startkonzentrationen der Komponenten [mol/m³]
+        _Oi (list | np.ndarray): Startkonzentrationen der Komponenten [mol/m³]
         ii (int): Anzahl der Iterationen
 
     Returns:
-        list: Umsatzgrade F für jede Verweilzeit (dimensionslos zwischen 0 und 1)
+        np.ndarray: Umsatzgrade F für jede Verweilzeit (dimensionslos zwischen 0 und 1)
 
     Raises:
         ValueError: Bei negativen Temperaturen oder Konzentrationen
@@ -384,15 +635,38 @@ def verweilzeitUmsatzmake(tau, k0, Ea, T, C_0i, ii):
         C_0i = _Oi    # Initialkonzentrationen [mol/m³]
         F_i  = [0]    # Umsatzgrad-Array initialisiert mit F(t=0)=0
     """
-    R_0 = 8.314
-    k = k0 * (np.e) ** (-Ea / (R_0 * T))
-    tauexp = tau
-    F_i = [0]
+    k = _arrhenius(k0, Ea, T)
+    tau = _asfloat(tau)
+    C_0i = _asfloat(C_0i)
+    # numba prüft keine Indizes, daher vor dem Kernel abfangen
+    if tau.shape[0] < ii:
+        raise IndexError("tau muss mindestens ii Verweilzeiten enthalten.")
+    if C_0i.shape[0] < 1:
+        raise IndexError("C_0i muss mindestens eine Startkonzentration enthalten.")
+    return _cstr(tau, k, C_0i, ii)
+
+
+@njit(cache=True)
+def _cstr(tau, k, C_0i, ii):
+    """
+    Rekursion des CSTR-Umsatzgrades. F[i+1] hängt von F[i] ab, daher bleibt die
+    Schleife skalar; mit numba wird sie kompiliert, sonst läuft sie in Python.
+    Sonderfälle werden explizit behandelt, damit beide Wege gleich reagieren.
+    """
+    F_i = np.empty(ii + 1)
+    F_i[0] = 0.0
+    n0 = C_0i.shape[0]
+    C = np.empty(n0 + ii)
+    C[:n0] = C_0i
     for i in range(ii):
-        a = tauexp[i] * k * C_0i[i] * 60
-        F = (1 + 2 * a - np.sqrt(1 + 4 * a * (1 - F_i[i]))) / (2 * a)
-        F_i.append(F)
-        C_0i.append(F * C_0i[i])
+        a = tau[i] * k * C[i] * 60.0
+        if a == 0.0:
+            raise ZeroDivisionError("a = tau * k * C0 ist 0.")
+        disk = 1 + 4 * a * (1 - F_i[i])
+        # Negative Diskriminante ergibt wie np.sqrt NaN statt eines Fehlers
+        F = (1 + 2 * a - math.sqrt(disk)) / (2 * a) if disk >= 0 else np.nan
+        F_i[i + 1] = F
+        C[n0 + i] = F * C[i]
     return F_i
 
 
@@ -409,23 +683,23 @@ def molenmake(CA_0, CA_inf, W_0, W_inf, conductivity):
         CA_inf (float): Endkonzentration der Komponente.
         W_0 (float): Anfangswert der Leitfähigkeit.
         W_inf (float): Endwert der Leitfähigkeit.
-        conductivity (list): Liste der gemessenen Leitfähigkeitswerte.
+        conductivity (list | np.ndarray): Die gemessenen Leitfähigkeitswerte.
 
     Returns:
-        list: Liste der berechneten Konzentrationen zu jedem Leitfähigkeitswert.
+        np.ndarray: Die berechneten Konzentrationen zu jedem Leitfähigkeitswert.
     """
-    CA_t = [
-        (W - W_inf) / (W_0 - W_inf) * (CA_0 - CA_inf) + CA_inf for W in conductivity
-    ]
+    W = _asfloat(conductivity)
+    slope = (CA_0 - CA_inf) / (W_0 - W_inf)
+    CA_t = slope * (W - W_inf) + CA_inf
 
     return CA_t
 
 
 def Leitfähigkeitsumsatzmake(CA_0, CA_inf, W_0, W_inf, conductivity):
-
-    CA_t = [
-        (W - W_inf) / (W_0 - W_inf) * (CA_0 - CA_inf) + CA_inf for W in conductivity
-    ]
+    """
+    Alias von molenmake: rechnet Leitfähigkeitswerte linear in Konzentrationen um.
+    """
+    return molenmake(CA_0, CA_inf, W_0, W_inf, conductivity)
 
 
 def Manuelleauswertung(E_t, t, mol_in, Volstrom, c_in, k0, Ea, T):
@@ -433,11 +707,15 @@ def Manuelleauswertung(E_t, t, mol_in, Volstrom, c_in, k0, Ea, T):
     Führt die vollständige Auswertung der Verweilzeitdaten eines Rohreaktors durch.
 
     Args:
-        E_t (list): Liste der E(t)-Werte (normierte Verweilzeitdichte).
-        t (list): Liste der Zeitpunkte t.
+        E_t (list | np.ndarray): E(t)-Werte (normierte Verweilzeitdichte).
+        t (list | np.ndarray): Zeitpunkte t.
         mol_in (float): Eingegebene Stoffmenge des Tracers (n₀).
         Volstrom (float): Volumenstrom durch den Reaktor (V̇).
 
+    Raises:
+        ValueError: Wenn die berechnete Varianz sigma^2 negativ ist (z.B. bei
+                    verrauschten oder zu grob abgetasteten E(t)-Daten).
+
     Returns:
         dict: Ein Dictionary mit allen berechneten Kenngrößen.
         "Mittlere Verweilzeit t_bar [min]": mü1,
@@ -452,20 +730,34 @@ def Manuelleauswertung(E_t, t, mol_in, Volstrom, c_in, k0, Ea, T):
         "theoretischer Umsatz": f_i
     """
 
-    # Annahme: nIntegration ist die Trapezregel, hier mit numpy implementiert
-    E_tn = E_t / nIntegration(t, E_t)
-    # Berechnung der Momente und Kennzahlen
-    mü1 = nIntegration(t, [a * b for a, b in zip(E_tn, t)])
-    mü2 = nIntegration(t, [a * (b**2) for a, b in zip(E_tn, t)])
-    sigsq = mü2 - mü1**2
-    sig = sigsq**0.5
-    sigma_theta_sq = sigsq / (mü1**2)
-    D_uL = (-2 + (4 + 32 * sigma_theta_sq) ** 0.5) / 16
+    t = _asfloat(t)
+    E_t = _asfloat(E_t)
+    # Trapezgewichte nur einmal berechnen und für alle drei Integrale nutzen
+    w = _trapezgewichte(t)
+    E_tn = E_t / _trapez(E_t, w)
+    # Berechnung der Momente und Kennzahlen; ein Puffer für E_tn*t und E_tn*t²
+    tmp = np.empty_like(t)
+    np.multiply(E_tn, t, out=tmp)
+    mü1 = _trapez(tmp, w)
+    np.multiply(tmp, t, out=tmp)
+    mü2 = _trapez(tmp, w)
+    mu1_sq = mü1 * mü1
+    sigsq = mü2 - mu1_sq
+    if sigsq < 0:
+        raise ValueError(
+            f"Die berechnete Varianz ist negativ (sigma^2 = {sigsq:.3g} min^2). "
+            "Bitte E(t) und t prüfen (z.B. Rauschen oder zu grobe Abtastung)."
+        )
+    sig = math.sqrt(sigsq)
+    sigma_theta_sq = sigsq / mu1_sq
+    D_uL = (-2 + math.sqrt(4 + 32 * sigma_theta_sq)) / 16
     V_eff = mü1 * Volstrom
-    c_t = [a * mol_in / Volstrom for a in E_tn]
-    R_0 = 8.314
-    k = k0 * (np.e) ** (-Ea / (R_0 * T))
-    f_i = (c_in * mü1 * 60 * k) / (1 + (c_in * mü1 * 60 * k))
+    inv_V = mol_in / Volstrom
+    # E_tn wird danach nicht mehr gebraucht und direkt zu c(t) skaliert
+    c_t = np.multiply(E_tn, inv_V, out=E_tn)
+    k = _arrhenius(k0, Ea, T)
+    Da = c_in * mü1 * 60 * k
+    f_i = Da / (1 + Da)
     # Ergebnisse in einem Dictionary sammeln
     ergebnisse = {
         "Mittlere Verweilzeit t_bar [min]": mü1,
@@ -477,7 +769,7 @@ def Manuelleauswertung(E_t, t, mol_in, Volstrom, c_in, k0, Ea, T):
         "Effektives Reaktorvolumen V_eff [Einheit von Volstrom * s]": V_eff,
         "Zeitachse t [min]": t,
         "theoretischer Umsatz": f_i,
-        "Konzentrationskurve c(t)": list(c_t),
+        "Konzentrationskurve c(t)": c_t,
     }
 
     print_results_pretty(ergebnisse)